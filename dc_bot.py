@@ -1,9 +1,9 @@
 import logging
-import json
+import asyncio
 import io
 import discord
 
-from utils import ConfigManager, RoleManager, ChannelManager
+from utils import ConfigManager, RoleManager, ChannelManager, dump_json
 
 class BotClient(discord.Client):
     """Main bot client that handles events."""
@@ -21,6 +21,8 @@ class BotClient(discord.Client):
         self.config = ConfigManager()
         self.role_manager = RoleManager(self)
         self.channel_manager = ChannelManager(self)
+        self._emoji_list_cache = {}
+        self._emoji_list_generation = {}
 
     async def on_ready(self):
         """
@@ -31,6 +33,15 @@ class BotClient(discord.Client):
         logging.info(f"🌐 Logged in as {self.user}")
         await self.role_manager.post_or_update_role_message()
 
+    async def close(self):
+        """
+        Flush any pending config changes before shutting down the client.
+        """
+        try:
+            await self.config.flush()
+        finally:
+            await super().close()
+
     async def on_message(self, message):
         """
         Handles incoming messages.
@@ -52,9 +63,16 @@ class BotClient(discord.Client):
                 await message.channel.send("⛔ 你沒有權限使用這個指令！")
                 return
 
-            emoji_mapping = {str(e.id): e.name for e in message.guild.emojis}
-            json_data = json.dumps({"emoji_ids": emoji_mapping}, indent=4, ensure_ascii=False)
-            file = discord.File(io.BytesIO(json_data.encode()), filename="emoji_list.json")
+            data = self._emoji_list_cache.get(message.guild.id)
+            if data is None:
+                generation = self._emoji_list_generation.get(message.guild.id, 0)
+                emoji_mapping = {str(e.id): e.name for e in message.guild.emojis}
+                # serialize off the event loop so large servers don't stall the gateway
+                data = await asyncio.to_thread(dump_json, {"emoji_ids": emoji_mapping})
+                # don't cache a snapshot that an emoji update invalidated while serializing
+                if self._emoji_list_generation.get(message.guild.id, 0) == generation:
+                    self._emoji_list_cache[message.guild.id] = data
+            file = discord.File(io.BytesIO(data), filename="emoji_list.json")
             await message.channel.send("🔍 這是伺服器的表情 ID 列表：", file=file)
         
         if message.content.startswith("!dump_channel_msg"):
@@ -65,6 +83,31 @@ class BotClient(discord.Client):
             await self.fetch_channel_msg(message.channel.id)
             
 
+    async def on_guild_emojis_update(self, guild, before, after):
+        """
+        Handles changes to a guild's emojis.
+
+        Args:
+            guild (discord.Guild): The guild whose emojis were updated.
+            before (Sequence[discord.Emoji]): The emojis before the update.
+            after (Sequence[discord.Emoji]): The emojis after the update.
+
+        Invalidates the cached emoji list for the guild.
+        """
+        self._emoji_list_generation[guild.id] = self._emoji_list_generation.get(guild.id, 0) + 1
+        self._emoji_list_cache.pop(guild.id, None)
+
+    async def on_guild_role_delete(self, role):
+        """
+        Handles a role being deleted from a guild.
+
+        Args:
+            role (discord.Role): The role that was deleted.
+
+        Calls the role manager to forget the cached role.
+        """
+        await self.role_manager.handle_role_delete(role)
+
     async def on_raw_reaction_add(self, payload):
         """
         Handles adding a reaction to a message.
@@ -89,7 +132,7 @@ class BotClient(discord.Client):
 
     async def fetch_channel_msg(self, channel_id):
         self.channel_manager.channel_id = channel_id
-        await self.channel_manager.handle_channel(save_file=f"{channel_id}_dump.json")
+        await self.channel_manager.handle_channel(save_file=f"{channel_id}_dump.ndjson")
 
 if __name__ == '__main__':
     ACESS_TOKEN = 'YOUR_ACESS_TOKEN'
@@ -105,5 +148,12 @@ if __name__ == '__main__':
     intents.guilds = True
     intents.reactions = True
 
+    # uvloop is optional (not available on Windows); fall back to the default event loop
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        logging.info("uvloop not installed, using default event loop.")
+
     client = BotClient(intents=intents)
     client.run(ACESS_TOKEN)
\ No newline at end of file
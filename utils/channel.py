@@ -1,10 +1,23 @@
 
 import os
-import json
 import logging
 import aiohttp
+import aiofiles
 import asyncio
-from tqdm import tqdm
+from dataclasses import dataclass
+
+from .util import dump_json
+
+
+@dataclass(slots=True)
+class MsgRec:
+    """A single dumped channel message."""
+    id: int
+    author: str
+    timestamp: str
+    content: str
+    attachments: list
+
 
 class ChannelManager():
     def __init__(self, bot_client):
@@ -12,72 +25,112 @@ class ChannelManager():
         self.save_path = None
         self.channel_id = None
         self.save_path = "download"
+        self.download_workers = 16
 
     async def fetch_channel(self):
         logging.info("🚧 Running in dev mode!")
         return self.bot_client.get_channel(self.channel_id)
     
-    async def download_image(self, session, url, file_path):
+    async def download_image(self, session, url, file_path, size=None):
+        # resume support: skip files already downloaded completely by a previous run
+        if os.path.exists(file_path) and (size is None or os.path.getsize(file_path) == size):
+            logging.debug("skip existing %s", file_path)
+            return
+
+        part_path = file_path + ".part"
         try:
             async with session.get(url) as response:
                 if response.status == 200:
-                    with open(file_path, 'wb') as f:
-                        f.write(await response.read())
+                    # write to a .part file so an interrupted download never looks complete
+                    async with aiofiles.open(part_path, 'wb') as f:
+                        async for chunk in response.content.iter_chunked(64 * 1024):
+                            await f.write(chunk)
+                    await asyncio.to_thread(os.replace, part_path, file_path)
                 else:
-                    logging.error(f"❌ Failed to download {url} (HTTP {response.status})")
+                    logging.error("❌ Failed to download %s (HTTP %s)", url, response.status)
         except Exception as e:
-            logging.error(f"download fail {url}:{e}")
+            logging.error("download fail %s:%s", url, e)
+
 
+    async def download_worker(self, session, queue):
+        while True:
+            url, file_path, size = await queue.get()
+            try:
+                await self.download_image(session, url, file_path, size)
+            finally:
+                queue.task_done()
 
     async def fetch_all_messages(self):
         channel = await self.fetch_channel()
 
-        logging.info(f"start fetch channel msgs...")
-        raw_msg = [ msg async for msg  in channel.history(limit=None, oldest_first=True) ]
-
-        logging.info(f"fetch # of msg:{len(raw_msg)}")
-        logging.info(f"start processing...")
-
-        msg_data = list()
-        download_task = list()
+        logging.info("start fetch channel msgs...")
 
-        async with aiohttp.ClientSession() as session:
-            for msg in tqdm(raw_msg, desc="downloading msgs"):
-                msg_info = {
-                    'id':msg.id,
-                    'author': str(msg.author),
-                    'timestamp': str(msg.created_at),
-                    'content': msg.content,
-                    'attachments': []
-                }
+        save_path = self.save_path
+        msg_count = 0
+        seen = {}
+        download_queue = asyncio.Queue(maxsize=self.download_workers * 2)
 
-                for attachment in msg.attachments:
-                    url = attachment.url
-                    file_path = os.path.join(self.save_path, f"{msg.id}_{attachment.filename}")
-                    # await self.download_image(url, file_path)
-                    msg_info['attachments'].append({
-                        'url':url,
-                        'save_as':file_path
-                    })
+        # the worker pool bounds concurrent downloads; attachments all come from one CDN host,
+        # so both the total and per-host connection limits match the worker count
+        connector = aiohttp.TCPConnector(
+            limit=self.download_workers,
+            limit_per_host=self.download_workers,
+            ttl_dns_cache=300
+        )
+        # no total cap: large attachments may legitimately take minutes to stream
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=60)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            workers = [
+                asyncio.create_task(self.download_worker(session, download_queue))
+                for _ in range(self.download_workers)
+            ]
+            try:
+                async for msg in channel.history(limit=None, oldest_first=True):
+                    msg_info = MsgRec(
+                        id=msg.id,
+                        author=str(msg.author),
+                        timestamp=str(msg.created_at),
+                        content=msg.content,
+                        attachments=[]
+                    )
 
-                    download_task.append(self.download_image(session, url, file_path))
-                msg_data.append(msg_info)
+                    for attachment in msg.attachments:
+                        url = attachment.url
+                        # CDN links carry signed query params; the path identifies the file
+                        url_key = url.split('?', 1)[0]
+                        file_path = seen.get(url_key)
+                        if file_path is None:
+                            file_path = f"{save_path}/{msg.id}_{attachment.id}_{attachment.filename}"
+                            seen[url_key] = file_path
+                            await download_queue.put((url, file_path, attachment.size))
+                        msg_info.attachments.append({
+                            'url':url,
+                            'save_as':file_path
+                        })
+                    yield msg_info
+                    msg_count += 1
+                    if msg_count % 500 == 0:
+                        logging.info("processed %d msgs", msg_count)
 
-            await asyncio.gather(*download_task)
+                await download_queue.join()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
 
-        return msg_data
+        logging.info("fetch # of msg:%d", msg_count)
 
     async def save_to_json(self):
-        msg = await self.fetch_all_messages()
-        with open(self.save_file, 'w', encoding='utf-8') as f:
-            json.dump(msg, f, ensure_ascii=False, indent=4)
+        # write NDJSON (one message per line) so the dump never sits in memory
+        async with aiofiles.open(self.save_file, 'wb') as f:
+            async for msg_info in self.fetch_all_messages():
+                await f.write(dump_json(msg_info, indent=False) + b'\n')
         logging.info(f"✅Successfully saved messages and images data:{self.save_file}")
 
-    async def handle_channel(self, save_file='channel_dump.json'):
+    async def handle_channel(self, save_file='channel_dump.ndjson'):
         if self.channel_id is None:
             logging.error("❌ channel_id is not setting.")
             return
-        if os.path.exists(self.save_path) == False:
-            os.mkdir(self.save_path)
+        os.makedirs(self.save_path, exist_ok=True)
         self.save_file = save_file
         await self.save_to_json()
\ No newline at end of file
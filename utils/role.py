@@ -1,10 +1,17 @@
 
 import logging
+import asyncio
 import discord
 
 class RoleManager:
     """Handles role assignment and reaction-based role management."""
 
+    # add flag -> (member method, log message, action name)
+    _OPS = {
+        True: (discord.Member.add_roles, "➕ Added role %s for %s.", "add"),
+        False: (discord.Member.remove_roles, "➖ Removed role %s from %s.", "remove"),
+    }
+
     def __init__(self, bot_client):
         """
         Initialize the RoleManager with the given bot client.
@@ -14,11 +21,21 @@ class RoleManager:
         """
         self.bot = bot_client
         self.config = bot_client.config
-        self.dev_mode = self.config.get("dev_mode")
-        self.rule_msg = self.config.get("default_rule_msg", "")
-        self.role_message_id = self.config.get("role_message_id", 0)
-        self.emoji_ids = self.config.get("emoji_ids", {})
-        self.emoji_to_role = self.config.get("emoji_to_role", {})
+        config = self.config.config
+        self.dev_mode = config.get("dev_mode")
+        self.rule_msg = config.get("default_rule_msg", "")
+        self.role_message_id = int(config.get("role_message_id", 0) or 0)
+        self._role_message_ids = {self.role_message_id}
+        self.emoji_ids = config.get("emoji_ids", {})
+        self.emoji_to_role = {str(k): v for k, v in config.get("emoji_to_role", {}).items()}
+        self._emoji_render = {}
+        for eid in self.emoji_to_role:
+            if eid not in self.emoji_ids:
+                logging.warning(f"⚠️ Emoji Key[{eid}] not in emoji_ids, skipping.")
+                continue
+            self._emoji_render[eid] = f"<:{self.emoji_ids[eid]}:{eid}>"
+        self._valid_emojis = frozenset(self._emoji_render)
+        self._role_cache = {}
 
     async def post_or_update_role_message(self):
         """
@@ -45,15 +62,19 @@ class RoleManager:
             return
 
         content = self.rule_msg
-        for emoji_id, role_info in self.emoji_to_role.items():
+        for emoji_id, emoji in self._emoji_render.items():
+            role_info = self.emoji_to_role[emoji_id]
             role = channel.guild.get_role(role_info['role_id'])
             if role:
-                content += f"> 🔹 {role_info['role_name']} → <:{self.emoji_ids[emoji_id]}:{emoji_id}>\n"
+                self._role_cache[role.id] = role
+                content += f"> 🔹 {role_info['role_name']} → {emoji}\n"
 
         message = None
+        existing = set()
         if self.role_message_id:
             try:
                 message = await channel.fetch_message(self.role_message_id)
+                existing = {str(r.emoji.id) for r in message.reactions if r.me and getattr(r.emoji, 'id', None)}
                 await message.edit(content=content)
                 logging.info("📝 Updated existing role message.")
             except discord.NotFound:
@@ -65,22 +86,36 @@ class RoleManager:
         if message is None:
             message = await channel.send(content)
             self.role_message_id = message.id
+            self._role_message_ids = {message.id}
             self.config.set("role_message_id", message.id)
             logging.info("⚡ Posted new role message.")
 
         if message:
-            for emoji_id in self.emoji_to_role.keys():
-                emoji = f"<:{self.emoji_ids[emoji_id]}:{emoji_id}>"
-                try:
-                    await message.add_reaction(emoji)
+            # issue reactions concurrently; discord.py serializes them per rate-limit bucket
+            emojis = [emoji for eid, emoji in self._emoji_render.items() if eid not in existing]
+            results = await asyncio.gather(
+                *(message.add_reaction(emoji) for emoji in emojis),
+                return_exceptions=True
+            )
+            for emoji, result in zip(emojis, results):
+                if isinstance(result, discord.HTTPException):
+                    logging.error(f"❌ Failed to add emoji {emoji}: {result}")
+                elif isinstance(result, BaseException):
+                    logging.error(f"⚠️ Unexpected error with emoji {emoji}: {result}")
+                else:
                     logging.info(f"✅ Successfully added reaction: {emoji}")
-                except discord.HTTPException as e:
-                    logging.error(f"❌ Failed to add emoji {emoji}: {e}")
-                except Exception as e:
-                    logging.error(f"⚠️ Unexpected error with emoji {emoji}: {e}")
+
+    async def handle_role_delete(self, role):
+        """
+        Drop a deleted role from the role cache.
+
+        Args:
+            role (discord.Role): The role that was deleted.
+        """
+        self._role_cache.pop(role.id, None)
 
     async def handle_role(self, payload, add=True):
-        if payload.message_id != self.role_message_id:
+        if payload.message_id not in self._role_message_ids:
             return
 
         guild = self.bot.get_guild(payload.guild_id)
@@ -90,35 +125,32 @@ class RoleManager:
         
         # confirm emoji in emoji_to_role mapping
         emoji = str(payload.emoji.id)
-        if emoji not in self.emoji_to_role.keys():
-            logging.info(f"⚠️ Emoji Key[{emoji}] not in emoji_to_role mapping.")
+        if emoji not in self._valid_emojis:
+            logging.info("⚠️ Emoji Key[%s] not in emoji_to_role mapping.", emoji)
             return
 
         role_id = self.emoji_to_role[emoji]['role_id']
         if not role_id:
-            logging.info(f"⚠️ No role_id found for emoji {emoji}.")
+            logging.info("⚠️ No role_id found for emoji %s.", emoji)
             return
 
-        role = guild.get_role(role_id)
+        role = self._role_cache.get(role_id) or guild.get_role(role_id)
         if not role:
-            logging.info(f"⚠️ Role {role_id} not found in guild.")
+            logging.info("⚠️ Role %s not found in guild.", role_id)
             return
 
         member = (payload.member if add else guild.get_member(payload.user_id))
         if not member:
-            logging.info(f"⚠️ Member {payload.user_id} not found.")
+            logging.info("⚠️ Member %s not found.", payload.user_id)
             return
 
         # don't reaction to ourselves
         if member == self.bot.user:
             return
 
+        op, msg, name = self._OPS[add]
         try:
-            if add:
-                await member.add_roles(role)
-                logging.info(f"➕ Added role {role.name} for {member.display_name}.")
-            else:
-                await member.remove_roles(role)
-                logging.info(f"➖ Removed role {role.name} from {member.display_name}.")
+            await op(member, role)
+            logging.info(msg, role.name, member.display_name)
         except discord.HTTPException as e:
-            logging.error(f"❌ Failed to {'add' if add else 'remove'} role: {e}")
+            logging.error("❌ Failed to %s role: %s", name, e)
@@ -1,13 +1,63 @@
-
+import os
 import json
+import asyncio
 import logging
+import dataclasses
+import aiofiles
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logging.basicConfig(level=logging.INFO)
 
 
+def _json_default(obj):
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_json(obj, indent=True):
+    """
+    Serialize obj to UTF-8 JSON bytes, using orjson when available.
+
+    Dataclass instances are serialized as objects.
+
+    Args:
+        obj: The JSON-serializable object.
+        indent (bool): Whether to pretty-print the output (default is True).
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None, default=_json_default).encode('UTF-8')
+
+
+def load_json(data):
+    """
+    Deserialize JSON bytes or str, using orjson when available.
+
+    Args:
+        data (bytes | str): The JSON document.
+
+    Returns:
+        The decoded object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class ConfigManager:
     """Handles loading and saving bot configuration."""
 
+    FLUSH_DELAY = 1.0
+
     def __init__(self, config_file="config.json"):
         """
         Initialize the ConfigManager with the given config file.
@@ -17,22 +67,77 @@ class ConfigManager:
         """
         self.config_file = config_file
         self.config = self.load_config()
+        self._dirty = False
+        self._generation = 0
+        self._flush_task = None
+        self._save_lock = asyncio.Lock()
 
     def load_config(self):
         try:
-            with open(self.config_file, "r", encoding='UTF-8') as f:
-                return json.load(f)
+            with open(self.config_file, "rb") as f:
+                return load_json(f.read())
         except FileNotFoundError:
             logging.error("⚠️ Config file not found!")
             return {}
 
-    def save_config(self):
-        with open(self.config_file, "w", encoding='UTF-8') as f:
-            json.dump(self.config, f, ensure_ascii=False, indent=4)
+    async def save_config(self):
+        """
+        Atomically write the config to disk without blocking the event loop.
+
+        The data is written to a temporary file next to the config file and then
+        moved over it, so a crash never leaves a truncated config.
+        """
+        tmp_file = self.config_file + ".tmp"
+        data = dump_json(self.config)
+        async with aiofiles.open(tmp_file, "wb") as f:
+            await f.write(data)
+        await asyncio.to_thread(os.replace, tmp_file, self.config_file)
 
     def get(self, key, default=None):
         return self.config.get(key, default)
 
     def set(self, key, value):
+        """
+        Update a config value and schedule a flush to disk.
+
+        Writes are debounced: bursts of set() calls within FLUSH_DELAY seconds
+        result in a single save. Without a running event loop the config is
+        saved immediately.
+        """
         self.config[key] = value
-        self.save_config()
\ No newline at end of file
+        self._dirty = True
+        self._generation += 1
+        if self._flush_task is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.flush())
+            return
+        self._flush_task = loop.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self):
+        await asyncio.sleep(self.FLUSH_DELAY)
+        self._flush_task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logging.error(f"❌ Failed to save config: {e}")
+
+    async def flush(self):
+        """
+        Write pending changes to disk, if any.
+
+        Waits for a save that is already in progress, and only marks the config
+        clean once a save covering every change so far has succeeded.
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        async with self._save_lock:
+            if not self._dirty:
+                return
+            generation = self._generation
+            await self.save_config()
+            if generation == self._generation:
+                self._dirty = False